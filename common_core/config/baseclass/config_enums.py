@@ -1,19 +1,59 @@
 # -*- coding: utf-8 -*-
-from enum import Enum
 
-from common_core.utils.enums.custom_enum import CustomEnum
 
+class _SentinelEnum:
+    """Lightweight stand-in for `Enum` used by the config machinery.
 
-class SystemEnvironment(Enum, metaclass=CustomEnum):
-    LOCAL = 0
-    TEST = 1
-    STAGING = 2
-    UAT = 3
-    PRODUCTION = 4
+    Members are singleton instances created once at import time, so
+    member comparison is an identity check and iteration is a plain
+    tuple walk -- no EnumMeta construction cost at import and no
+    `Enum.__eq__`/descriptor dispatch in the per-field loops of
+    ConfigMeta.
+    """
 
+    __slots__ = ("name", "value")
 
-class ConfigEnvVarType(Enum, metaclass=CustomEnum):
-    OS_ENVIRON = 1
-    CONFIG_YAML = 2
-    CONFIG_CLASS = 3
-    CONFIG_INSTANCE = 4
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def __repr__(self):
+        return f"<{type(self).__name__}.{self.name}: {self.value}>"
+
+    def __hash__(self):
+        return hash((type(self).__name__, self.value))
+
+    @classmethod
+    def _build_members(cls, **values):
+        cls.__members__ = {}
+        cls._value2member_map_ = {}
+        for name, value in values.items():
+            member = cls(name, value)
+            setattr(cls, name, member)
+            cls.__members__[name] = member
+            cls._value2member_map_[value] = member
+
+
+class SystemEnvironment(_SentinelEnum):
+    __slots__ = ()
+
+
+SystemEnvironment._build_members(
+    LOCAL=0,
+    TEST=1,
+    STAGING=2,
+    UAT=3,
+    PRODUCTION=4,
+)
+
+
+class ConfigEnvVarType(_SentinelEnum):
+    __slots__ = ()
+
+
+ConfigEnvVarType._build_members(
+    OS_ENVIRON=1,
+    CONFIG_YAML=2,
+    CONFIG_CLASS=3,
+    CONFIG_INSTANCE=4,
+)
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from dataclasses import InitVar, dataclass, field, fields
+import functools
+import re
 from string import ascii_uppercase, digits
-from typing import Any, List, _GenericAlias  # noqa
+from typing import Any, List, NamedTuple, _GenericAlias  # noqa
 
 #  {type: default value} of datatypes allowed in Config files
 _VALID_DATATYPES = {int: 0, str: "", bool: False}
@@ -11,18 +12,19 @@ _DEFAULT_DATATYPE = str
 # uppercase chars, digits, and underscore
 VALID_VARNAME_CHARS = set(ascii_uppercase + digits + "_")
 
+# Single-pass equivalent of the VALID_VARNAME_CHARS rules: at least 3
+# chars, no leading digit, only uppercase/digits/underscore.
+_VARNAME_MATCH = re.compile(r"\A[A-Z_][A-Z0-9_]{2,}\Z").match
+
+# Same rules with the ConfigField minimum length of 2; a fullmatch here
+# means field-name validation can skip the per-rule diagnostics.
+_NAME_MATCH = re.compile(r"\A[A-Z_][A-Z0-9_]+\Z").match
+
 ERR_PFX = "Environment Variable Config - "
 
 
 def is_valid_envvar_name(val):
-    return all(
-        [
-            isinstance(val, str),
-            list(set(val).difference(VALID_VARNAME_CHARS)) == [],
-            len(val) > 2,
-            val[0] not in digits,
-        ]
-    )
+    return type(val) is str and _VARNAME_MATCH(val) is not None
 
 
 class ConfigFieldError:
@@ -56,24 +58,116 @@ class ConfigFieldError:
 
 NONETYPE_CLASS = type(None)
 
+#  Name -> type lookup so the string form resolves with one dict get
+#  instead of a scan over _VALID_DATATYPES per call, and a frozenset for
+#  the membership check in the type branch.
+_DTYPE_NAME_LOOKUP = {t.__name__: t for t in _VALID_DATATYPES}
+_VALID_DTYPE_SET = frozenset(_VALID_DATATYPES)
+
+
+def _compile_datatype(datatype):
+    """Flatten a validated datatype into a (plain-type tuple, tuple of
+    per-generic argument-type tuples) pair for isinstance fast paths."""
+    if isinstance(datatype, type):
+        return (datatype,), ()
+    if isinstance(datatype, list):
+        singles = tuple(t for t in datatype if isinstance(t, type))
+        generics = tuple(
+            tuple(t for t in g.__args__ if isinstance(t, type))
+            for g in datatype
+            if isinstance(g, _GenericAlias)
+        )
+        return singles, generics
+    return (), ()
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_datatype_scalar(value):
+    """Resolve a single datatype given as a type or its string name.
+
+    The input space is tiny (int/str/bool and their names), so results
+    are memoized; repeated validation during field construction becomes
+    a cache hit."""
+    if isinstance(value, str):
+        return _DTYPE_NAME_LOOKUP.get(value.lower())
+    if isinstance(value, type) and value in _VALID_DTYPE_SET:
+        return value
+    return None
+
+
+class _FieldSpec(NamedTuple):
+    """Static stand-in for `dataclasses.Field` metadata, holding just the
+    pieces that ConfigField's validation machinery reads."""
 
-@dataclass
-class ConfigField:
     name: str
-    # datatype can be any singular type of the established VALID_DATATYPES,
-    # OR, it can be a list of any number of them.  The default is <str>
-    datatype: [type, List[type]] = NONETYPE_CLASS
-    alt_name: str = ""
-    required: bool = False
+    type: Any
     default: Any = None
-    locked: bool = False
-    metadata: dict = field(default_factory=dict)
-    _raise_exception_on_edit: InitVar[bool] = True
 
-    def __post_init__(self, _raise_exception_on_edit):
+
+class ConfigField:
+    __slots__ = (
+        "name",
+        "datatype",
+        "alt_name",
+        "required",
+        "default",
+        "locked",
+        "metadata",
+        "_raise_exception_on_edit",
+        "_single_types",
+        "_list_generics",
+        "_validate_cache",
+    )
+
+    # ConfigField's field metadata never changes after class creation, so
+    # it is declared statically instead of recovered via
+    # dataclasses.fields() on every attribute set/validate.
+    _fields_map = {
+        "name": _FieldSpec("name", str),
+        # datatype can be any singular type of the established
+        # VALID_DATATYPES, OR, it can be a list of any number of them.
+        # The default is <str>
+        "datatype": _FieldSpec(
+            "datatype", [type, List[type]], NONETYPE_CLASS
+        ),
+        "alt_name": _FieldSpec("alt_name", str, ""),
+        "required": _FieldSpec("required", bool, False),
+        "default": _FieldSpec("default", Any, None),
+        "locked": _FieldSpec("locked", bool, False),
+        "metadata": _FieldSpec("metadata", dict, None),
+    }
+
+    def __init__(
+        self,
+        name,
+        datatype=NONETYPE_CLASS,
+        alt_name="",
+        required=False,
+        default=None,
+        locked=False,
+        metadata=None,
+        _raise_exception_on_edit=True,
+    ):
+        # Stored before any public field: __setattr__ consults it on
+        # every invalid write (underscore names bypass validation).
+        self._raise_exception_on_edit = _raise_exception_on_edit
+        self.name = name
+        self.datatype = datatype
+        self.alt_name = alt_name
+        self.required = required
+        self.default = default
+        self.locked = locked
+        self.metadata = {} if metadata is None else metadata
         self._set_default_datatype()
         self.__validate()
-        pass
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(name={self.name!r}, "
+            f"datatype={self.datatype!r}, alt_name={self.alt_name!r}, "
+            f"required={self.required!r}, default={self.default!r}, "
+            f"locked={self.locked!r}, metadata={self.metadata!r})"
+        )
 
     def _set_default_datatype(self):
         if self.datatype is NONETYPE_CLASS and self.default is not None:
@@ -94,7 +188,10 @@ class ConfigField:
             if not self.__isinstance_by_attr(fieldname, val):
                 raise TypeError(
                     ConfigFieldError.TYPE_MISMATCH.format(
-                        fieldname, self._fields[fieldname].type, val, type(val)
+                        fieldname,
+                        self._fields_map[fieldname].type,
+                        val,
+                        type(val),
                     )
                 )
 
@@ -137,7 +234,7 @@ class ConfigField:
     def __isinstance_by_attr(cls, attr, value):
         if attr == "datatype":
             pass
-        if field_meta := cls._fields.get(attr, None):
+        if field_meta := cls._fields_map.get(attr, None):
             ftype = field_meta.type
             if ftype == Any:
                 return True
@@ -147,10 +244,50 @@ class ConfigField:
             raise KeyError(ConfigFieldError.INVALID_KEY.format(attr))
 
     def validate_value(self, value):
-        return self._isinstance_by_type(value, self.datatype)
+        # Validation of a (datatype, value) pair is pure, so hashable
+        # values are memoized per field; ConfigMeta re-validates the
+        # same defaults across MRO levels.  The cache is reset whenever
+        # datatype is reassigned.
+        if self.datatype is Any:
+            return True
+        try:
+            key = (value.__class__, value)
+            cached = self._validate_cache.get(key)
+        except TypeError:  # unhashable value
+            key = None
+            cached = None
+        if cached is not None:
+            return cached
+        result = False
+        if isinstance(value, self._single_types):
+            result = True
+        elif isinstance(value, list):
+            for argtypes in self._list_generics:
+                if all(isinstance(v, argtypes) for v in value):
+                    result = True
+                    break
+        if key is not None and len(self._validate_cache) < 1024:
+            self._validate_cache[key] = result
+        return result
 
     def cast_value(self, value, as_type=None):
-        as_type = as_type or self.datatype
+        if as_type is None:
+            # Fast path: the caster chain is the plain-type tuple already
+            # compiled when datatype was assigned; no recursion and no
+            # per-call isinstance dispatch.
+            casters = self._single_types
+            if len(casters) == 1:
+                try:
+                    return casters[0](value)
+                except Exception:
+                    return None
+            for caster in casters:
+                try:
+                    if casted_value := caster(value):
+                        return casted_value
+                except Exception:
+                    pass
+            return None
         if isinstance(as_type, type):
             try:
                 return as_type(value)
@@ -168,33 +305,33 @@ class ConfigField:
         """Return <type> if value is either in VALID_DATATYPES or
         the string name of one of those types. Else, return None"""
 
-        if isinstance(value, str):
-            for datatype in _VALID_DATATYPES.keys():
-                if value.lower() == datatype.__name__:
-                    return datatype
-        elif isinstance(value, type) and value in _VALID_DATATYPES:
-            return value
-        elif isinstance(value, list):
+        if isinstance(value, list):
             dtypes = []
             for dtype in value:
-                if cls._validate_datatype(dtype) and not isinstance(
+                if not isinstance(
                     dtype, (list, tuple)
-                ):
+                ) and _validate_datatype_scalar(dtype):
                     dtypes.append(dtype)
                 else:
                     return None
             return dtypes if dtypes else None
+        elif isinstance(value, (str, type)):
+            return _validate_datatype_scalar(value)
         return None
 
     def __validate_name(self, name=None, field="name"):
         name = name or self.name
-        ftype = self._fields[field].type
+        ftype = self._fields_map[field].type
         if not self.__isinstance_by_attr(field, name):
             raise TypeError(
                 ConfigFieldError.TYPE_MISMATCH
                 % (field, ftype, name, type(name))
             )
 
+        if _NAME_MATCH(name):
+            return
+
+        # Failure path only: classify which rule was broken.
         if len(name) < 2:
             raise ValueError(ConfigFieldError.NAME_LENGTH.format(field, name))
 
@@ -203,17 +340,12 @@ class ConfigField:
                 ConfigFieldError.NAME_STARTSWITH.format(field, name)
             )
 
-        if illegal_char := set(name).difference(VALID_VARNAME_CHARS):
-            raise ValueError(
-                ConfigFieldError.NAME_ILLEGALCHAR.format(
-                    field, ", ".join(list(illegal_char)), name
-                )
+        illegal_char = set(name).difference(VALID_VARNAME_CHARS)
+        raise ValueError(
+            ConfigFieldError.NAME_ILLEGALCHAR.format(
+                field, ", ".join(list(illegal_char)), name
             )
-
-    @classmethod
-    @property
-    def _fields(cls) -> dict:
-        return dict([(f.name, f) for f in fields(cls)])
+        )
 
     @property
     def is_valid(self):
@@ -227,7 +359,7 @@ class ConfigField:
         if isinstance(datatype, type):
             return datatype
         elif isinstance(datatype, str):
-            return self._validate_datatype(datatype)
+            return _validate_datatype_scalar(datatype)
         elif isinstance(datatype, (tuple, list)):
             as_list = []
             for dtype in datatype:
@@ -246,15 +378,24 @@ class ConfigField:
             else:
                 raise ValueError(
                     ConfigFieldError.TYPE_MISMATCH_SET.format(
-                        self.name, key, self.datatype, value, type(value)
+                        self.name,
+                        key,
+                        getattr(self, "datatype", NONETYPE_CLASS),
+                        value,
+                        type(value),
                     )
                 )
 
-        valid_value = self.__isinstance_by_attr(key, value) or key.startswith(
-            "_"
+        valid_value = key.startswith("_") or self.__isinstance_by_attr(
+            key, value
         )
         if valid_value:
             super().__setattr__(key, value)
+            if key == "datatype":
+                singles, generics = _compile_datatype(value)
+                object.__setattr__(self, "_single_types", singles)
+                object.__setattr__(self, "_list_generics", generics)
+                object.__setattr__(self, "_validate_cache", {})
         elif getattr(self, "_raise_exception_on_edit", False):
             raise ValueError(
                 ConfigFieldError.TYPE_MISMATCH_SET.format(
@@ -263,7 +404,9 @@ class ConfigField:
             )
 
     def __eq__(self, val):
-        if not isinstance(val, ConfigField):
-            return False
+        # Names are validated to be uppercase at construction, so a
+        # direct compare is equivalent to the old case-folded one.
+        return type(val) is ConfigField and self.name == val.name
 
-        return self.name.lower() == val.name.lower()
+    def __hash__(self):
+        return hash(self.name)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+import functools
 import os
+import re
 
 from common_core.config.baseclass.config_enums import ConfigEnvVarType
 from common_core.config.baseclass.config_field import (
@@ -7,14 +9,10 @@ from common_core.config.baseclass.config_field import (
     is_valid_envvar_name,
 )
 from common_core.config.baseclass.config_value import (
-    ConfigEnvVarType_Priority,
+    _PRIORITY_ORDER,
     ConfigValue,
 )
-from common_core.utils.baseclass import (
-    BaseNestedDataclass,
-    YAMLLoader,
-    nested_dataclass_factory,
-)
+from common_core.utils.baseclass import BaseNestedDataclass, YAMLLoader
 from common_core.utils.os_sys import get_abs_path
 
 #  _YAML_FILE_VAR is the name of the class attribute that ConfigMeta will
@@ -33,6 +31,24 @@ _LOCK_ATTRS_ON_INIT_VAR = "_LOCK_ATTRS_ON_INIT"
 # A Locked class cannot change attribute Values. (Default: True)
 _LOCK_VALUES_ON_INIT_VAR = "_LOCK_VALUES_ON_INIT"
 
+# Frozen once; consulted for every dict-valued class attribute when
+# deciding whether it describes ConfigField metadata.
+_CONFIG_FIELD_KEYS = frozenset(ConfigField._fields_map)
+
+# Bare-word directives accepted in tuple-style field declarations,
+# resolved with one dict get instead of chained string compares.
+_TUPLE_DIRECTIVES = {
+    "locked": ("locked", True),
+    "required": ("required", True),
+}
+
+# Reserved class attributes that must never be treated as config fields.
+_META_NAMES = frozenset(
+    {_YAML_FILE_VAR, _LOCK_ATTRS_ON_INIT_VAR, _LOCK_VALUES_ON_INIT_VAR}
+)
+
+_MISSING = object()
+
 _ERR_PFX = "ConfigMeta: "
 
 
@@ -51,6 +67,101 @@ class ConfigMetaError:
     )
 
 
+class _Meta:
+    """Per-class bookkeeping node for ConfigMeta.
+
+    A plain __slots__ class (children held in a dict keyed by class
+    name) standing in for the previous dynamically synthesized nested
+    dataclass tree, which paid a make_dataclass()/exec() round trip on
+    every class build for six boolean flags."""
+
+    __slots__ = (
+        "lock_attrs",
+        "lock_values",
+        "class_built",
+        "initialized",
+        "subclassed",
+        "top_parent",
+        "_children",
+    )
+
+    def __init__(self, lock_attrs=True, lock_values=True):
+        self.lock_attrs = lock_attrs
+        self.lock_values = lock_values
+        self.class_built = False
+        self.initialized = False
+        self.subclassed = False
+        self.top_parent = False
+        self._children = {}
+
+    def get_child(self, *child_names, auto_create=False):
+        if not child_names:
+            raise ValueError(
+                "get_child() - At least one child name must be provided."
+            )
+        node = self
+        for child_name in child_names:
+            child = node._children.get(child_name)
+            if child is None:
+                if not auto_create:
+                    raise KeyError(f"Child `{child_name}` not found.")
+                child = _Meta()
+                node._children[child_name] = child
+            node = child
+        return node
+
+
+# The __init_subclass__/__setattr__ hooks below are shared by every
+# ConfigMeta class -- defined once at module level, dispatching through
+# type(self)/cls at call time.  __init__ stays a per-class closure: its
+# super() chain must resolve against the defining class, not type(self).
+
+
+def _config_init_subclass(cls, **kwargs):
+    cls._local_meta.subclassed = True
+
+
+_CONFIG_INIT_SUBCLASS = classmethod(_config_init_subclass)
+
+
+def _make_instance_init(cls, local_init):
+    """Build the __init__ wrapper for one ConfigMeta class.
+
+    The wrapper closes over its defining class, so super() resolves
+    against the owner rather than type(self): a child's
+    super().__init__() lands on the parent's wrapper instead of
+    re-dispatching to the child's own init (infinite recursion), and
+    parent user-defined inits run before the class's own, as the
+    baseline closures chained them."""
+
+    def _config_instance_init(self, *args, **kwargs):
+        super(cls, self).__init__(*args, **kwargs)
+        if local_init is not None:
+            local_init(self, *args, **kwargs)
+        cls._local_meta.initialized = True
+        ConfigMeta._update_fast_locked(cls)
+
+    return _config_instance_init
+
+
+def _config_instance_setattr(self, key, value):
+    meta = type(self)._local_meta
+    if not meta.lock_values or not meta.initialized:
+        object.__setattr__(self, key, value)
+    else:
+        raise Exception("Class values locked")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml(yaml_file):
+    """Parse a YAML config file once and memoize the result.
+
+    Both __class_fields and __class_values need the parsed data, and
+    subclasses inheriting a _YAML_PATH would otherwise re-parse the same
+    file on every class build."""
+    return YAMLLoader(yaml_file).asdict
+
+
 class ConfigMeta(type):
     """Base metaclass for Config classes that can be loaded from environment
     and designed to manage subclassed and multiple inheritances."""
@@ -71,26 +182,32 @@ class ConfigMeta(type):
     def __new__(mcs, name, bases, attrs, *args, **kwargs):
         new_class = super().__new__(mcs, name, bases, attrs)
         # Class Metadata
-        new_class._metadata: BaseNestedDataclass
-        new_class._local_meta: BaseNestedDataclass = mcs._build_metadata(
-            new_class
-        )
+        new_class._metadata: _Meta
+        new_class._local_meta: _Meta = mcs._build_metadata(new_class)
+        mcs._update_fast_locked(new_class)
 
-        new_class.__init_subclass__ = classmethod(mcs.init_subclass())
-        local_defined_init_func = new_class.__init__
-        new_class.__init__ = mcs.init(new_class, local_defined_init_func)
-        new_class.__setattr__ = classmethod(mcs.set_attr(new_class))
+        new_class.__init_subclass__ = _CONFIG_INIT_SUBCLASS
+        new_class.__init__ = _make_instance_init(
+            new_class, attrs.get("__init__")
+        )
+        new_class.__setattr__ = _config_instance_setattr
         new_class._values: dict = {}
 
-        #  Get the absolute path of the YAML file, if provided
+        #  Get the absolute path of the YAML file, if provided, and pin
+        #  the parsed data on the class; subclasses that don't redeclare
+        #  _YAML_PATH share the parent's cached dict.
         if rel_yaml_file := getattr(new_class, _YAML_FILE_VAR, None):
             abs_yaml_file = get_abs_path(rel_yaml_file, new_class)
             setattr(new_class, _YAML_FILE_VAR, abs_yaml_file)
+            new_class._yaml_data = _load_yaml(abs_yaml_file)
+        else:
+            new_class._yaml_data = {}
 
         #  Import values from YAML and class attributes
         mcs.__import_values(new_class)
 
         new_class._local_meta.class_built = True
+        mcs._update_fast_locked(new_class)
         return new_class
 
     @classmethod
@@ -100,17 +217,7 @@ class ConfigMeta(type):
         lock_values = getattr(klass, _LOCK_VALUES_ON_INIT_VAR, True)
 
         if len(mro_keys) == 1:
-            default_fields = {
-                "lock_attrs": lock_attrs,
-                "lock_values": lock_values,
-                "class_built": False,
-                "initialized": False,
-                "subclassed": False,
-                "top_parent": False,
-            }
-            klass._metadata = nested_dataclass_factory(
-                mro_keys[0], default_fields
-            )
+            klass._metadata = _Meta(lock_attrs, lock_values)
             klass._metadata.top_parent = True
             return klass._metadata
         else:
@@ -122,46 +229,35 @@ class ConfigMeta(type):
             return child_meta
 
     def __setattr__(cls, key, value):
+        # _fast_locked flips on only at the class_built/initialized
+        # transitions, so until then every set takes the cheap path with
+        # no metadata lookups.
+        if not getattr(cls, "_fast_locked", False):
+            super().__setattr__(key, value)
+            return
         if meta := getattr(cls, "_local_meta", {}):
             if meta.class_built and meta.lock_attrs and key != "_local_meta":
                 raise AttributeError("Class attributes locked")
             if meta.initialized and meta.lock_values:
-                if value != getattr(cls, key):
+                # cls.__dict__ skips the MRO walk, and the identity check
+                # skips __eq__ dispatch when the same object is re-set.
+                old = cls.__dict__.get(key, _MISSING)
+                if old is not value and old != value:
                     raise AttributeError("Class values locked")
         super().__setattr__(key, value)
 
-    @classmethod
-    def set_attr(mcs, cls):
-        def _set_attr(cls, key, value):
-            if (
-                not cls._local_meta.lock_values
-                or not cls._local_meta.initialized
-            ):
-                super().__setattr__(key, value)
-            else:
-                raise Exception("Class values locked")
-
-        return _set_attr
-
-    @classmethod
-    def init(mcs, cls, local_init):
-        def _init(self, *args, **kwargs):
-            if cls._local_meta.top_parent:
-                # Pre_init_code here
-                print(f"Running pre-init from {cls.__name__}")
-            super(cls, self).__init__(*args, **kwargs)
-
-            local_init(self, *args, **kwargs)
-            cls._local_meta.initialized = True
-
-        return _init
-
     @staticmethod
-    def init_subclass():
-        def _init_subclass(cls, **kwargs):
-            cls._local_meta.subclassed = True
-
-        return _init_subclass
+    def _update_fast_locked(cls):
+        """Recompute the single boolean consulted by __setattr__."""
+        meta = cls.__dict__.get("_local_meta")
+        locked = bool(
+            meta
+            and (
+                (meta.class_built and meta.lock_attrs)
+                or (meta.initialized and meta.lock_values)
+            )
+        )
+        type.__setattr__(cls, "_fast_locked", locked)
 
     @staticmethod
     def __generate_config_field(
@@ -181,17 +277,25 @@ class ConfigMeta(type):
 
     @classmethod
     def __import_values(mcs, klass):
-        existing_values = {}
-        for base in klass.__bases__:
-            if isinstance(base, ConfigMeta):
+        # TODO: figure out how to import non-ConfigMeta base attrs
+        config_bases = [
+            base for base in klass.__bases__ if isinstance(base, ConfigMeta)
+        ]
+        if not config_bases:
+            existing_values = {}
+        else:
+            # Single ConfigMeta base is the overwhelmingly common case:
+            # one C-level dict copy instead of build-and-update.
+            existing_values = config_bases[0]._values.copy()
+            for base in config_bases[1:]:
                 existing_values.update(base._values)
-            else:
-                # TODO: figure out how to import non-ConfigMeta attrs
-                pass
 
         fields = mcs.__class_fields(klass)
         new_values = mcs.__class_values(klass, fields)
 
+        if not existing_values and not new_values:
+            return
+
         for value in new_values:
             if existing_value := existing_values.get(value.field.name, None):
                 value = existing_value.compare(value)
@@ -210,8 +314,7 @@ class ConfigMeta(type):
         fields = []
 
         # Get child YAML
-        if yaml_file := getattr(klass, _YAML_FILE_VAR, None):
-            yaml_data = YAMLLoader(yaml_file).asdict
+        if yaml_data := klass._yaml_data:
             for k, v in yaml_data.items():
                 if isinstance(v, (dict, type(None))):
                     fields.append(mcs.__generate_config_field(k, v))
@@ -219,19 +322,21 @@ class ConfigMeta(type):
                     fields.append(mcs.__generate_config_field(k, by_value=v))
 
         # Get Class
+        # Cheap first-character screen drops methods/dunders/lowercase
+        # attributes before the full name validation runs.
         for attr in [
             a
             for a in vars(klass)
-            if a != _YAML_FILE_VAR and is_valid_envvar_name(a)
+            if (a[:1].isupper() or a[:1] == "_")
+            and a not in _META_NAMES
+            and is_valid_envvar_name(a)
         ]:
             val = getattr(klass, attr)
             if isinstance(val, ConfigField):
                 fields.append(val)
             elif isinstance(val, dict):
-                if not set(val.keys()).difference(
-                    set(ConfigField._fields.keys())
-                ):
-                    fields.append(klass.generate_config_field(attr, val))
+                if _CONFIG_FIELD_KEYS.issuperset(val.keys()):
+                    fields.append(mcs.__generate_config_field(attr, val))
             elif isinstance(val, tuple):
                 metadata = {}
                 try:
@@ -239,23 +344,23 @@ class ConfigMeta(type):
                         if i == 0:  # first index is the value
                             metadata["datatype"] = type(item)
                         elif isinstance(item, str):
-                            if item.lower() == "locked":
-                                metadata["locked"] = True
-                            elif item.lower() == "required":
-                                metadata["required"] = True
-                            elif item.startswith(
-                                "metadata={"
-                            ) and item.endswith("}"):
+                            directive = _TUPLE_DIRECTIVES.get(item.lower())
+                            if directive is not None:
+                                metadata[directive[0]] = directive[1]
+                            elif (
+                                item[:10] == "metadata={"
+                                and item[-1:] == "}"
+                            ):
                                 field_meta = {}
                                 for metastr in [
                                     s.strip() for s in item.split(",")
                                 ]:
-                                    kw, val = parse_keyword_str(metastr)
-                                    field_meta[kw] = val
+                                    kw, kw_val = parse_keyword_str(metastr)
+                                    field_meta[kw] = kw_val
                                 metadata["metadata"] = field_meta
-                            elif set(item).intersection({"=", ":"}):
-                                kw, val = parse_keyword_str(item)
-                                metadata[kw] = val
+                            elif "=" in item or ":" in item:
+                                kw, kw_val = parse_keyword_str(item)
+                                metadata[kw] = kw_val
                     fields.append(mcs.__generate_config_field(attr, metadata))
                 except Exception:
                     pass
@@ -265,37 +370,45 @@ class ConfigMeta(type):
 
     @classmethod
     def __class_values(mcs, klass, class_fields):
-        yaml_data = {}
-        if yaml_file := getattr(klass, _YAML_FILE_VAR, None):
-            yaml_data = YAMLLoader(yaml_file).asdict
+        yaml_data = klass._yaml_data
+
+        # Index each source once; the per-field loop below then only does
+        # O(1) set-membership checks instead of re-probing os.environ,
+        # vars(klass), and the YAML dict for every field at every priority.
+        klass_vars = vars(klass)
+        field_names = {field.name for field in class_fields}
+        env_keys = os.environ.keys() & field_names
+        class_keys = klass_vars.keys() & field_names
+        yaml_keys = yaml_data.keys() & field_names
+
         values = []
         for field in class_fields:
-            value = None
-            for priority in reversed(ConfigEnvVarType_Priority):
+            name = field.name
+            # Collect every candidate for this field, then pick the
+            # winner in one scan; the old pairwise compare() chain paid
+            # a common()/priority dunder cascade per level.
+            candidates = []
+            for priority in _PRIORITY_ORDER:
                 new_value = None
-                if (
-                    priority == ConfigEnvVarType.OS_ENVIRON
-                    and field.name in os.environ
-                ):
-                    new_value = os.environ.get(field.name)
+                if priority is ConfigEnvVarType.OS_ENVIRON:
+                    if name not in env_keys:
+                        continue
                     new_value = ConfigValue(
-                        field, new_value, priority, klass.__name__
+                        field, os.environ[name], priority, klass.__name__
                     )
-                elif (
-                    priority == ConfigEnvVarType.CONFIG_CLASS
-                    and field.name in vars(klass)
-                ):
-                    new_value = getattr(klass, field.name)
-                    if isinstance(new_value, tuple):
-                        new_value = new_value[0]
+                elif priority is ConfigEnvVarType.CONFIG_CLASS:
+                    if name not in class_keys:
+                        continue
+                    class_value = klass_vars[name]
+                    if isinstance(class_value, tuple):
+                        class_value = class_value[0]
                     new_value = ConfigValue(
-                        field, new_value, priority, klass.__name__
+                        field, class_value, priority, klass.__name__
                     )
-                elif (
-                    priority == ConfigEnvVarType.CONFIG_YAML
-                    and field.name in yaml_data
-                ):
-                    yaml_value = yaml_data[field.name]
+                elif priority is ConfigEnvVarType.CONFIG_YAML:
+                    if name not in yaml_keys:
+                        continue
+                    yaml_value = yaml_data[name]
                     if not isinstance(yaml_value, (dict, type(None))):
                         if isinstance(yaml_value, tuple):
                             yaml_value = yaml_value[0]
@@ -304,34 +417,42 @@ class ConfigMeta(type):
                         )
                 else:
                     continue
-                if new_value:
-                    value = value.compare(new_value) if value else new_value
-                elif field.default is not None:
+                if new_value is None and field.default is not None:
                     new_value = ConfigValue(
                         field,
                         field.default,
                         ConfigEnvVarType.CONFIG_CLASS,
                         klass.__name__,
                     )
-                    value = value.compare(new_value) if value else new_value
-            if value:
-                values.append(value)
+                if new_value:
+                    candidates.append(new_value)
+            if not candidates:
+                continue
+            if field.locked:
+                # A locked value can never be overwritten, so the first
+                # (lowest-priority) candidate stands.
+                values.append(candidates[0])
+                continue
+            best = candidates[0]
+            for cand in candidates[1:]:
+                # <= keeps the later candidate on priority ties, which
+                # is how the pairwise compare() chain resolved them.
+                if cand._source_priority <= best._source_priority:
+                    best = cand
+            values.append(best)
         return values
 
 
+# Splits on the first '=' or ':' in one pass; no match means the
+# delimiter is missing or sits at the first/last character.
+_KW_SEP_MATCH = re.compile(r"([^=:]+)[=:](.+)", re.DOTALL).match
+
+
 def parse_keyword_str(kw_str):
     """takes str 'keyword=my value' and returns {keyword: 'my_value'}"""
-    delimiters = ["=", ":"]
-
-    # Find first instance of any delimiter
-    sep = min(
-        [i for i in [kw_str.find(d) for d in delimiters] if i >= 0] or [-1]
-    )
-    if 0 >= sep or sep == len(kw_str) - 1:
-        # (delimiter not found or is first/last character)
+    if (m := _KW_SEP_MATCH(kw_str)) is None:
         raise Exception(f"bad format: {kw_str}")
-    else:
-        kw, val = kw_str[:sep], kw_str[sep + 1 :]
+    kw, val = m.group(1, 2)
 
     quotes = ("'", '"')
     if val[0] in quotes and val[-1] in quotes and val[0] == val[-1]:
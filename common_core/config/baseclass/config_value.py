@@ -1,21 +1,32 @@
 # -*- coding: utf-8 -*-
-from dataclasses import MISSING, InitVar, dataclass
+from dataclasses import MISSING
 from typing import Any
 
 from common_core.config.baseclass.config_enums import ConfigEnvVarType
 from common_core.config.baseclass.config_field import ConfigField
 
-ConfigEnvVarType_Priority = [
+ConfigEnvVarType_Priority = (
     # ConfigEnvVarType determines the sequence in which ConfigMeta searches
     # for and defines config variables...with those of lower priority being
     # defined first, but possibly overwritten by those of higher priority.
     # Note: A variable of low priority can be 'locked', thus disabling
     # a higher priority from overwriting it.
+    # Immutable config, so a tuple.
     ConfigEnvVarType.CONFIG_INSTANCE,  # Highest Priority
     ConfigEnvVarType.CONFIG_CLASS,
     ConfigEnvVarType.CONFIG_YAML,
     ConfigEnvVarType.OS_ENVIRON,  # Lowest Priority
-]
+)
+
+# Lowest-priority-first walk order used by ConfigMeta when resolving
+# values; frozen once so no caller pays for reversed() per class build.
+_PRIORITY_ORDER = tuple(reversed(ConfigEnvVarType_Priority))
+
+# Source -> rank lookup; comparison dunders run once per merged config
+# key, so the linear list.index scan is replaced with a dict get.
+_SOURCE_PRIORITY = {
+    src: i for i, src in enumerate(ConfigEnvVarType_Priority)
+}
 
 _ERR_PFX = "ConfigValue: "
 
@@ -43,34 +54,55 @@ class ConfigValueError:
     LOCKED = _ERR_PFX + "Locked. Cannot edit field `{0}`."
 
 
-@dataclass
 class ConfigValue:
-    field: ConfigField
-    value: Any = type(MISSING)
-    source: ConfigEnvVarType = ConfigEnvVarType.OS_ENVIRON
-    source_name: str = ""
-    _raise_exception_on_edit: InitVar[bool] = True
-
-    def __post_init__(self, _raise_exception_on_edit):
-        self._value = type(MISSING)  # self.value_set == False
-        if self.value is not type(MISSING):
-            self._value = self.value
-        self._initialized = True
-
-    def __getattribute__(self, item):
-        if item == "value" and self.initialized:
-            if self._value is type(MISSING):
-                if self.field.default:
-                    return self.field.default
-                else:
-                    return None
-            return self._value
-        return super().__getattribute__(item)
-
-    def __getattr__(self, item):
-        if item == "initialized":
-            return False
-        return super().__getattr__(item)
+    __slots__ = (
+        "field",
+        "_value",
+        "source",
+        "source_name",
+        "_raise_exception_on_edit",
+        "_initialized",
+        "_source_priority",
+    )
+
+    def __init__(
+        self,
+        field: ConfigField,
+        value: Any = type(MISSING),
+        source: ConfigEnvVarType = ConfigEnvVarType.OS_ENVIRON,
+        source_name: str = "",
+        _raise_exception_on_edit: bool = True,
+    ):
+        # ConfigMeta builds one ConfigValue per (key x level) pair, so
+        # construction writes hit the slot descriptors directly instead
+        # of funnelling six calls through the overridden __setattr__.
+        oset = object.__setattr__
+        oset(self, "_raise_exception_on_edit", _raise_exception_on_edit)
+        oset(self, "field", field)
+        oset(self, "source", source)
+        oset(self, "_source_priority", _SOURCE_PRIORITY.get(source))
+        oset(self, "source_name", source_name)
+        # type(MISSING) == self.value_set is False
+        oset(self, "_value", value)
+        oset(self, "_initialized", True)
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(field={self.field!r}, "
+            f"value={self.value!r}, source={self.source!r}, "
+            f"source_name={self.source_name!r})"
+        )
+
+    @property
+    def value(self):
+        # Reads of every other attribute previously paid for this
+        # special case through a __getattribute__ override; a plain
+        # property keeps the default-aware behavior for `value` only.
+        if self._value is type(MISSING):
+            if self.field.default:
+                return self.field.default
+            return None
+        return self._value
 
     def __setattr__(self, key, value):
         if self.initialized and self.is_locked:
@@ -81,26 +113,39 @@ class ConfigValue:
             self._value = value
         else:
             super().__setattr__(key, value)
+            if key == "source":
+                object.__setattr__(
+                    self, "_source_priority", _SOURCE_PRIORITY.get(value)
+                )
         if (
             self._raise_exception_on_edit
             and self.initialized
             and key != "_initialized"
         ):
-            self.__validate()
-
-    def __validate(self):
+            # The structural invariants (field/source types) can only be
+            # broken by reassigning those attributes; a plain value write
+            # re-checks the value alone.
+            if key in ("value", "_value"):
+                self._validate_value()
+            else:
+                self._validate_structural()
+                self._validate_value()
+
+    def _validate_structural(self):
         if not isinstance(self.field, ConfigField):
             raise ValueError(
                 ConfigValueError.BAD_FIELD.format(type(self.field))
             )
-        field_name = self.field.name
         if not isinstance(self.source, ConfigEnvVarType):
             raise ValueError(
                 ConfigValueError.BAD_SOURCE.format(
-                    field_name, type(self.source)
+                    self.field.name, type(self.source)
                 )
             )
+
+    def _validate_value(self):
         if not self.field.validate_value(self.value):
+            field_name = self.field.name
             if self.value is None and self.field.required:
                 raise ValueError(
                     ConfigValueError.REQUIRED_VALUE.format(field_name)
@@ -118,19 +163,21 @@ class ConfigValue:
     @property
     def is_valid(self) -> bool:
         try:
-            self.__validate()
+            self._validate_structural()
+            self._validate_value()
             return True
         except ValueError:
             return False
 
     @property
     def initialized(self):
-        return self.__dict__.get("_initialized", False)
+        return getattr(self, "_initialized", False)
 
     @property
     def source_priority(self):
-        # Lower Number = Higher Priority
-        return ConfigEnvVarType_Priority.index(self.source)
+        # Lower Number = Higher Priority; cached whenever `source` is
+        # assigned, so compares cost a slot read and an int compare.
+        return self._source_priority
 
     def __ge__(self, config_value):
         return self > config_value or self == config_value
@@ -182,22 +229,35 @@ class ConfigValue:
         A 'locked' value can never be overwritten, regardless of priority
         """
 
-        if self.common(config_value):
-            if (  # New value is unset, so ignore
-                not config_value.value_set
-                or
-                # Existing value is locked
-                (self.value_set and self.is_locked)
-                or
-                # Existing value has higher priority
-                (self.value_set and self > config_value)
-            ):
+        if not self.common(config_value):
+            raise TypeError(
+                ConfigValueError.UNCOMMON.format(type(config_value))
+            )
+        # New value is unset, so ignore
+        if not config_value.value_set:
+            return self
+        if self.value_set:
+            # Existing value is locked
+            if self.is_locked:
                 return self
-            return config_value
-        raise TypeError(ConfigValueError.UNCOMMON.format(type(config_value)))
+            # Existing value has higher priority.  The dunders would
+            # re-check common(); compare the cached ranks directly.
+            if self._source_priority < config_value._source_priority:
+                return self
+        return config_value
 
     def copy(self, unlocked=True):
         new_field = self.field
-        if unlocked:
-            new_field.locked = False
+        if unlocked and new_field.locked:
+            # Never unlock in place: the field object is shared with the
+            # original ConfigValue (and possibly other configs).
+            new_field = ConfigField(
+                new_field.name,
+                new_field.datatype,
+                new_field.alt_name,
+                new_field.required,
+                new_field.default,
+                locked=False,
+                metadata=dict(new_field.metadata),
+            )
         return ConfigValue(new_field, self.value, self.source)
@@ -90,6 +90,7 @@ print(main.child2.grandchild1.asdict)  # {'metafield1': False,
                                             'metafield2': True,
                                             'metafield3': False}
 """
+import operator
 from dataclasses import InitVar, dataclass, field, fields, make_dataclass
 
 ERR_PFX = "NestedDataclassError: "
@@ -107,19 +108,68 @@ class NestedDataclassError:
     )
 
 
+# Generated classes memoized by (name, field signature); make_dataclass
+# exec-compiles a new class per call, which dominates add_child loops
+# that stamp out identical subtrees.  Defaults are part of the key
+# because they are baked into the generated class.
+_CLASS_CACHE: dict = {}
+
+# get_mro_keys results per (class, reverse) pair; MROs never change
+# after class creation.
+_MRO_KEYS_CACHE: dict = {}
+
+
 def nested_dataclass_factory(name: str, field_dct: dict, parent=None):
-    fields = []
-    for field_name, field_value in field_dct.items():
-        fields.append(
-            (field_name, type(field_value), field(default=field_value))
+    try:
+        cache_key = (
+            name,
+            tuple(
+                sorted(
+                    (k, type(v), v) for k, v in field_dct.items()
+                )
+            ),
         )
-    return make_dataclass(name, fields=fields, bases=(BaseNestedDataclass,))(
-        _parent=parent
-    )
+        klass = _CLASS_CACHE.get(cache_key)
+    except TypeError:  # unhashable or unorderable defaults
+        cache_key = None
+        klass = None
+    if klass is None:
+        dc_fields = []
+        for field_name, field_value in field_dct.items():
+            dc_fields.append(
+                (field_name, type(field_value), field(default=field_value))
+            )
+        klass = make_dataclass(
+            name,
+            fields=dc_fields,
+            bases=(BaseNestedDataclass,),
+            slots=True,
+        )
+        _cache_class_fields(klass)
+        if cache_key is not None:
+            _CLASS_CACHE[cache_key] = klass
+    return klass(_parent=parent)
+
+
+def _cache_class_fields(klass):
+    """Pin the field tuple and name set on the class; the field set is
+    fixed at creation time, so per-write `fields()` walks are wasted."""
+    klass.__field_tuple__ = tuple(fields(klass))
+    klass.__field_names__ = frozenset(f.name for f in klass.__field_tuple__)
+    klass.__field_types__ = {f.name: f.type for f in klass.__field_tuple__}
+    names = tuple(f.name for f in klass.__field_tuple__)
+    klass.__field_name_tuple__ = names
+    # One C-level call fetching every field value for asdict; None when
+    # there are no fields (attrgetter requires at least one name).
+    klass.__field_getter__ = operator.attrgetter(*names) if names else None
 
 
 @dataclass
 class BaseNestedDataclass:
+    # Bookkeeping slots live here; the generated subclasses add their
+    # own field slots (slots=True), so instances carry no __dict__.
+    __slots__ = ("_parent", "_children", "_initialized")
+
     _parent: InitVar
 
     def __post_init__(self, _parent=None):
@@ -133,11 +183,23 @@ class BaseNestedDataclass:
 
     @property
     def _fields(self):
-        return fields(self)
+        klass = type(self)
+        if "__field_tuple__" not in klass.__dict__:
+            _cache_class_fields(klass)
+        return klass.__field_tuple__
 
     @property
     def asdict(self):
-        dct = {f.name: getattr(self, f.name) for f in self._fields}
+        klass = type(self)
+        if "__field_getter__" not in klass.__dict__:
+            _cache_class_fields(klass)
+        names = klass.__field_name_tuple__
+        if not names:
+            dct = {}
+        elif len(names) == 1:  # attrgetter returns a bare scalar here
+            dct = {names[0]: klass.__field_getter__(self)}
+        else:
+            dct = dict(zip(names, klass.__field_getter__(self)))
         for child_name, child in self._children.items():
             dct[child_name] = child.asdict
         return dct
@@ -151,10 +213,17 @@ class BaseNestedDataclass:
         """Returns a list of the class names in the MRO of the class."""
         # The MRO names can be used as keys in nesting the dataclasses
         # if the nested dictionary is meant to mimic a class hierarchy.
+        # The MRO is immutable per class, so both orderings are memoized;
+        # callers get a fresh list since they may mutate the result.
+        cached = _MRO_KEYS_CACHE.get((klass, reverse))
+        if cached is not None:
+            return list(cached)
         if mro := getattr(klass, "__mro__", None):
+            names = [k.__name__ for k in mro if k != object]
             if reverse:
-                return list(reversed([k.__name__ for k in mro if k != object]))
-            return [k.__name__ for k in mro if k != object]
+                names.reverse()
+            _MRO_KEYS_CACHE[(klass, reverse)] = tuple(names)
+            return names
 
     def add_child(self, child_name: str, force=False):
         if child_name in self._children and not force:
@@ -193,14 +262,21 @@ class BaseNestedDataclass:
 
     def __setattr__(self, key, value):
         if getattr(self, "_initialized", False):
-            if key not in [f.name for f in self._fields]:
+            klass = type(self)
+            if "__field_names__" not in klass.__dict__:
+                _cache_class_fields(klass)
+            if key not in klass.__field_names__:
                 raise KeyError(
                     NestedDataclassError.FIELD_NOT_FOUND.format(key)
                 )
-            if not isinstance(value, type(getattr(self, key))):
+            # The declared type equals the default's type (the factory
+            # derives it that way), so reading the current value back
+            # just to take its type is redundant.
+            expected = klass.__field_types__[key]
+            if not isinstance(value, expected):
                 raise TypeError(
                     NestedDataclassError.FIELD_TYPE_MISMATCH.format(
-                        key, type(getattr(self, key)), type(value)
+                        key, expected, type(value)
                     )
                 )
         super().__setattr__(key, value)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from common_core.utils.baseclass import yaml_loader
+from common_core.utils.baseclass.yaml_loader import YAMLLoader
+
+
+def _load_fresh(path):
+    # Clear the in-memory cache so each load exercises the sidecar path.
+    with yaml_loader._YAML_CACHE_LOCK:
+        yaml_loader._YAML_CACHE.clear()
+    return YAMLLoader(str(path)).asdict
+
+
+def test_sidecar_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv(yaml_loader._SIDECAR_ENV_VAR, "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    source = tmp_path / "config.yaml"
+    source.write_text("NAME: Craig\nCOUNT: 3\n")
+
+    first = _load_fresh(source)
+    cache_dir = tmp_path / "cache" / "common_core" / "yaml"
+    assert any(f.suffix == ".json" for f in cache_dir.iterdir())
+
+    # Second load is served from the sidecar and must match the parse.
+    second = _load_fresh(source)
+    assert second == first == {"NAME": "Craig", "COUNT": 3}
+
+
+def test_sidecar_skips_non_json_documents(tmp_path, monkeypatch):
+    monkeypatch.setenv(yaml_loader._SIDECAR_ENV_VAR, "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    dates = tmp_path / "dates.yaml"
+    dates.write_text("when: 2020-01-01\n")
+    keys = tmp_path / "keys.yaml"
+    keys.write_text("1: one\n")
+
+    # Date values aren't JSON-serializable; integer keys don't survive
+    # a JSON round trip.  Both load fine but must not be cached.
+    assert "when" in _load_fresh(dates)
+    assert _load_fresh(keys) == {1: "one"}
+    assert _load_fresh(keys) == {1: "one"}
+
+    cache_dir = tmp_path / "cache" / "common_core" / "yaml"
+    leftovers = list(cache_dir.iterdir()) if cache_dir.is_dir() else []
+    assert leftovers == []  # no sidecars and no leaked .tmp files
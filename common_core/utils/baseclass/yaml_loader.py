@@ -1,5 +1,87 @@
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
 from common_core.utils.yaml import load_yaml
 
+# Parsed-file cache keyed by (abspath, mtime_ns, size), so an edited or
+# replaced file never serves stale data.  Callers receive deep copies;
+# the cached dicts themselves are never handed out for mutation.
+_YAML_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
+# Opt-in on-disk sidecar cache: parsed YAML is mirrored as JSON (roughly
+# an order of magnitude faster to load) under the user cache dir, keyed
+# by a path hash plus mtime/size so edits invalidate naturally.
+_SIDECAR_ENV_VAR = "COMMON_CORE_YAML_JSON_CACHE"
+
+
+def _sidecar_enabled():
+    return os.environ.get(_SIDECAR_ENV_VAR) == "1"
+
+
+def _sidecar_path(path, stat):
+    cache_base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    digest = hashlib.sha1(path.encode()).hexdigest()
+    return os.path.join(
+        cache_base,
+        "common_core",
+        "yaml",
+        f"{digest}.{stat.st_mtime_ns}.{stat.st_size}.json",
+    )
+
+
+def _read_sidecar(sidecar):
+    try:
+        with open(sidecar) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sidecar(sidecar, data):
+    """Atomically write the sidecar and drop stale ones for the same
+    source file.  Best-effort: any failure just skips the cache."""
+    try:
+        payload = json.dumps(data)
+        if json.loads(payload) != data:
+            # JSON can't represent this document faithfully (e.g.
+            # non-string keys come back as strings), so a sidecar hit
+            # would return different data than a fresh parse.
+            return
+    except (TypeError, ValueError):
+        # Unserializable values (dates, custom tags): no sidecar.
+        return
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(sidecar)
+        basename = os.path.basename(sidecar)
+        digest = basename.split(".", 1)[0]
+        os.makedirs(cache_dir, exist_ok=True)
+        for name in os.listdir(cache_dir):
+            if name.startswith(digest + ".") and name != basename:
+                try:
+                    os.remove(os.path.join(cache_dir, name))
+                except OSError:
+                    pass
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
 
 class YAMLLoader:
     def __init__(self, yaml_filepath):
@@ -14,12 +96,32 @@ class YAMLLoader:
 
     @classmethod
     def _load_yaml_file(cls, filename=None):
-        if filename:
+        if not filename:
+            return {}
+        try:
+            path = os.path.abspath(filename)
+            stat = os.stat(path)
+        except (FileNotFoundError, OSError):
+            return {}
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with _YAML_CACHE_LOCK:
+            if (cached := _YAML_CACHE.get(key)) is not None:
+                _YAML_CACHE.move_to_end(key)
+                return copy.deepcopy(cached)
+        sidecar = _sidecar_path(path, stat) if _sidecar_enabled() else None
+        data = _read_sidecar(sidecar) if sidecar else None
+        if data is None:
             try:
-                return load_yaml(filename)
+                data = load_yaml(path)
             except FileNotFoundError:
-                pass
-        return {}
+                return {}
+            if sidecar:
+                _write_sidecar(sidecar, data)
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[key] = data
+            if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                _YAML_CACHE.popitem(last=False)
+        return copy.deepcopy(data)
 
     @property
     def asdict(self):
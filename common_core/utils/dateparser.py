@@ -1,18 +1,25 @@
 # -*- coding: utf-8 -*-
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import Union
 
-import pytz
 from dateutil import parser
 from google.protobuf.timestamp_pb2 import Timestamp  # noqa
 from google.type.date_pb2 import Date as GoogleDate
 from google.type.datetime_pb2 import DateTime as GoogleDateTime
 
+# Stdlib singleton; pytz built a fresh tzinfo through a Python-level
+# localize() on some paths.
+UTC = timezone.utc
+
+# datetime.min.time() allocates a fresh time object per call; the
+# midnight used when widening a bare date is constant.
+_MIDNIGHT = datetime.min.time()
+
 
 def from_proto_timestamp(proto_timestamp: Union[Timestamp, dict]) -> datetime:
     if isinstance(proto_timestamp, dict):
         proto_timestamp = Timestamp(**proto_timestamp)
-    return proto_timestamp.ToDatetime(tzinfo=pytz.UTC)
+    return proto_timestamp.ToDatetime(tzinfo=UTC)
 
 
 def from_proto_datetime(
@@ -20,7 +27,49 @@ def from_proto_datetime(
 ) -> datetime:
     if isinstance(proto_datetime, dict):
         proto_datetime = GoogleDateTime(**proto_datetime)
-    return proto_datetime.ToDatetime(tzinfo=pytz.UTC)
+    return proto_datetime.ToDatetime(tzinfo=UTC)
+
+
+def _parse_int(date_input) -> datetime:
+    return datetime.fromtimestamp(date_input, UTC)
+
+
+def _parse_str(date_input) -> datetime:
+    dt = parser.parse(date_input)
+    return dt.astimezone(UTC) if dt.tzinfo else dt.replace(tzinfo=UTC)
+
+
+def _parse_timestamp(date_input) -> datetime:
+    return from_proto_timestamp(date_input).astimezone(UTC)
+
+
+def _parse_proto_datetime(date_input) -> datetime:
+    return from_proto_datetime(date_input).astimezone(UTC)
+
+
+def _parse_datetime(date_input) -> datetime:
+    return (
+        date_input.astimezone(UTC)
+        if date_input.tzinfo
+        else date_input.replace(tzinfo=UTC)
+    )
+
+
+def _parse_date(date_input) -> datetime:
+    return datetime.combine(date_input, _MIDNIGHT).replace(tzinfo=UTC)
+
+
+# Exact-type dispatch for the common cases; subclasses miss here and
+# fall back to the isinstance chain in parse_input.
+_PARSE_DISPATCH = {
+    int: _parse_int,
+    str: _parse_str,
+    Timestamp: _parse_timestamp,
+    GoogleDateTime: _parse_proto_datetime,
+    GoogleDate: _parse_proto_datetime,
+    datetime: _parse_datetime,
+    date: _parse_date,
+}
 
 
 class DateParser:
@@ -35,26 +84,20 @@ class DateParser:
     def parse_input(date_input) -> datetime:
         if date_input is None:
             return None
+        if handler := _PARSE_DISPATCH.get(type(date_input)):
+            return handler(date_input)
         elif isinstance(date_input, int):
-            return datetime.fromtimestamp(date_input, pytz.UTC)
+            return _parse_int(date_input)
         elif isinstance(date_input, str):
-            dt = parser.parse(date_input)
-            return (
-                dt.astimezone(pytz.utc) if dt.tzinfo else pytz.utc.localize(dt)
-            )
+            return _parse_str(date_input)
         elif isinstance(date_input, Timestamp):
-            return from_proto_timestamp(date_input).astimezone(pytz.utc)
+            return _parse_timestamp(date_input)
         elif isinstance(date_input, (GoogleDateTime, GoogleDate)):
-            return from_proto_datetime(date_input).astimezone(pytz.utc)
+            return _parse_proto_datetime(date_input)
         elif isinstance(date_input, datetime):
-            return (
-                date_input.astimezone(pytz.utc)
-                if date_input.tzinfo
-                else date_input.replace(tzinfo=pytz.utc)
-            )
+            return _parse_datetime(date_input)
         elif isinstance(date_input, date):
-            dt = datetime.combine(date_input, datetime.min.time())
-            return dt.replace(tzinfo=pytz.utc)
+            return _parse_date(date_input)
         else:
             raise ValueError(f"Unsupported date format: {type(date_input)}")
 
@@ -7,8 +7,16 @@ class CustomEnum(EnumMeta):
 
     def names(cls):
         """Return a list of names of the Enum members"""
-        return [
+        # Members are fixed once the Enum class exists, so the list is
+        # built once per class; __dict__ access avoids inheriting a
+        # parent class's cache.
+        cached = cls.__dict__.get("_names_cache")
+        if cached is not None:
+            return cached
+        result = [
             member.name
             for member in cls.__members__.values()
             if isinstance(member, Enum)
         ]
+        cls._names_cache = result
+        return result
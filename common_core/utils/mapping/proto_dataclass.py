@@ -24,44 +24,121 @@ proto = person_mapper.protobuf  # Returns a PersonProto instance
 
 
 """
+import datetime as _dt
+import warnings
 from dataclasses import fields, is_dataclass
 
+from google.protobuf.internal import api_implementation
 from google.protobuf.message import Message
 
-from common_core.utils.dateparser import DateParser
 from common_core.utils.enums.custom_enum import CustomEnum, Enum
 from common_core.utils.metaclass.json_type import JsonType
 
+if api_implementation.Type() == "python":
+    # Attribute sets, CopyFrom and descriptor walks -- everything the
+    # converters do -- run an order of magnitude faster on the
+    # C-accelerated runtimes ('upb'/'cpp').
+    warnings.warn(
+        "protobuf is running its pure-Python implementation; install "
+        "the C-accelerated runtime for much faster mapper conversions.",
+        RuntimeWarning,
+    )
+
 
 class MapperSource(Enum, metaclass=CustomEnum):
     DATACLASS = 0
     PROTOBUF = 1
 
 
+# Absent-attribute marker; three-arg getattr against it runs in C where
+# hasattr pays for Python-level exception machinery per probe.
+_MISSING = object()
+
+# Field plans keyed by (proto class, sorted mapping items); see
+# MapperMeta._build_field_plan.
+_PLAN_CACHE = {}
+
+_EPOCH = _dt.datetime(1970, 1, 1, tzinfo=_dt.timezone.utc)
+_EPOCH_DATE = _dt.date(1970, 1, 1)
+
+
+def _assign_timestamp(ts, value):
+    """Write a Timestamp field from a dataclass value.
+
+    datetime/date values get seconds/nanos computed directly with
+    integer arithmetic; DateParser (which allocates several wrappers
+    per call) only runs for everything else."""
+    vtype = type(value)
+    if vtype is _dt.datetime:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=_dt.timezone.utc)
+        delta = value - _EPOCH
+        ts.seconds = delta.days * 86400 + delta.seconds
+        ts.nanos = delta.microseconds * 1000
+    elif vtype is _dt.date:
+        ts.seconds = (value - _EPOCH_DATE).days * 86400
+        ts.nanos = 0
+    else:
+        # Deferred: DateParser drags in dateutil and the proto wrapper
+        # types, and this fallback is the uncommon path.
+        from common_core.utils.dateparser import DateParser
+
+        ts.CopyFrom(DateParser(value).proto_timestamp)
+
+
 class MapMeta:
+    __slots__ = (
+        "dataclass",
+        "protobuf",
+        "mapped_fields",
+        "transforms",
+        "child_mapper",
+        "field_plan",
+    )
+
     def __init__(
-        self, dataclass, protobuf, mapped_fields, transforms, child_mapper
+        self,
+        dataclass,
+        protobuf,
+        mapped_fields,
+        transforms,
+        child_mapper,
+        field_plan=(),
     ):
         self.dataclass = dataclass
         self.protobuf = protobuf
-        self.mapped_fields = mapped_fields
+        # Frozen (dc_field, pr_field) pairs; conversion paths only ever
+        # iterate the mapping, and tuple iteration skips the .items()
+        # view per call.
+        self.mapped_fields = (
+            tuple(mapped_fields.items())
+            if isinstance(mapped_fields, dict)
+            else tuple(mapped_fields)
+        )
         self.transforms = transforms
         self.child_mapper = child_mapper
+        # (dc_field, pr_field, message_type_full_name_or_None) triples,
+        # frozen at class creation so conversions never re-probe the
+        # proto descriptor.
+        self.field_plan = field_plan
 
 
 class MapperMeta(type):
-    _mappermeta_attrs = [
-        ("dataclass", None),
-        ("protobuf", None),
-        ("transforms", {}),
-        ("mapped_fields", {}),
-        ("child_mapper", {}),
-    ]
+    # (attribute, default factory) pairs; factories keep the fallback
+    # dicts per-class instead of shared mutable singletons.
+    _mappermeta_attrs = (
+        ("dataclass", lambda: None),
+        ("protobuf", lambda: None),
+        ("transforms", dict),
+        ("mapped_fields", dict),
+        ("child_mapper", dict),
+    )
 
     def __new__(mcs, name, bases, dct):
-        mapper_attr = dict(
-            [(k, dct.get(f"__{k}__", v)) for k, v in mcs._mappermeta_attrs]
-        )
+        mapper_attr = {
+            k: dct.get(f"__{k}__", default())
+            for k, default in mcs._mappermeta_attrs
+        }
         dc_class, pr_class, mapped_fields = mcs._validate_mapper(mapper_attr)
         map_meta = MapMeta(
             dataclass=dc_class,
@@ -69,15 +146,24 @@ class MapperMeta(type):
             mapped_fields=mapped_fields,
             transforms=mapper_attr["transforms"],
             child_mapper=mapper_attr["child_mapper"],
+            field_plan=mcs._build_field_plan(pr_class, mapped_fields),
         )
         mapper_cls = super().__new__(mcs, name, bases, {"meta": map_meta})
         mapper_cls.__init__ = mcs._init(mapper_cls)
         mapper_cls._convert = mcs._convert(mapper_cls)
-        mapper_cls._convert_proto_to_dataclass = (
-            mcs._convert_proto_to_dataclass(mapper_cls)
-        )
-        mapper_cls._convert_dataclass_to_proto = (
-            mcs._convert_dataclass_to_proto(mapper_cls)
+        if all(mtype is None for _, _, mtype in map_meta.field_plan):
+            # All-scalar plans get a specialized straight-line converter
+            # in this direction too; plans with message fields keep the
+            # generic loop.
+            mapper_cls._convert_proto_to_dataclass = mcs._codegen_pr_to_dc(
+                map_meta.field_plan
+            )
+        else:
+            mapper_cls._convert_proto_to_dataclass = (
+                mcs._convert_proto_to_dataclass(mapper_cls)
+            )
+        mapper_cls._convert_dataclass_to_proto = mcs._codegen_dc_to_proto(
+            map_meta.field_plan
         )
         mapper_cls.dataclass = property(
             lambda self: self._convert(MapperSource.DATACLASS)
@@ -85,8 +171,34 @@ class MapperMeta(type):
         mapper_cls.protobuf = property(
             lambda self: self._convert(MapperSource.PROTOBUF)
         )
+        mapper_cls.batch_to_proto = classmethod(mcs._batch_to_proto)
+        mapper_cls.batch_to_dataclass = classmethod(mcs._batch_to_dataclass)
         return mapper_cls
 
+    @staticmethod
+    def _batch_to_proto(cls, dataclass_instances):
+        """Convert a sequence of dataclass instances in one pass,
+        hoisting the per-call meta lookups out of the loop."""
+        convert = cls._convert_dataclass_to_proto
+        proto_cls = cls.meta.protobuf
+        mapped_fields = cls.meta.mapped_fields
+        return [
+            convert(cls, dc, proto_cls, mapped_fields)
+            for dc in dataclass_instances
+        ]
+
+    @staticmethod
+    def _batch_to_dataclass(cls, proto_instances):
+        """Bulk counterpart of _batch_to_proto for the reverse
+        direction."""
+        convert = cls._convert_proto_to_dataclass
+        dc_cls = cls.meta.dataclass
+        mapped_fields = cls.meta.mapped_fields
+        return [
+            convert(cls, pr, dc_cls, mapped_fields)
+            for pr in proto_instances
+        ]
+
     @classmethod
     def _init(cls, klass):
         def init(self, input_data):
@@ -132,55 +244,117 @@ class MapperMeta(type):
             self, proto_instance, dataclass_cls, mapped_fields
         ):
             dataclass_instance = dataclass_cls()
-            for dc_field, pr_field in mapped_fields.items():
-                if hasattr(dataclass_instance, dc_field) and hasattr(
-                    proto_instance, pr_field
-                ):
-                    setattr(
-                        dataclass_instance,
-                        dc_field,
-                        getattr(proto_instance, pr_field),
-                    )
+            # Local bindings turn the per-field LOAD_GLOBALs into
+            # LOAD_FASTs inside the loop.
+            _getattr = getattr
+            _setattr = setattr
+            missing = _MISSING
+            # Plan fields are validated at class creation, so only the
+            # source read needs a guard.
+            for dc_field, pr_field, _ in self.meta.field_plan:
+                pr_value = _getattr(proto_instance, pr_field, missing)
+                if pr_value is not missing:
+                    _setattr(dataclass_instance, dc_field, pr_value)
             return dataclass_instance
 
         return convert_proto_to_dataclass
 
     @classmethod
-    def _convert_dataclass_to_proto(cls, klass):
-        def convert_dataclass_to_proto(
-            self, dataclass_instance, proto_cls, mapped_fields
-        ):
-            proto_instance = proto_cls()
-            for dc_field, pr_field in mapped_fields.items():
-                if hasattr(dataclass_instance, dc_field) and hasattr(
-                    proto_instance, pr_field
-                ):
-                    mtype = proto_cls.DESCRIPTOR.fields_by_name[
-                        pr_field
-                    ].message_type
-                    if mtype:
-                        if mtype.full_name == "google.protobuf.Timestamp":
-                            dc_value = getattr(dataclass_instance, dc_field)
-                            try:
-                                getattr(proto_instance, pr_field).CopyFrom(
-                                    DateParser(dc_value).proto_timestamp
-                                )
-                            except Exception as e:
-                                raise ValueError(
-                                    f"Error converting dataclass.{dc_field}"
-                                    f" value '{dc_value}' to "
-                                    f"proto.{pr_field}: {e}"
-                                )
-
-                    else:
-                        setattr(
-                            proto_instance,
-                            pr_field,
-                            getattr(dataclass_instance, dc_field),
-                        )
-            return proto_instance
-
-        return convert_dataclass_to_proto
+    def _codegen_pr_to_dc(cls, field_plan):
+        """Exec-compile a proto-to-dataclass converter for plans made of
+        scalar fields only.
+
+        With no message types to dispatch on, the body is a flat run of
+        guarded attribute copies -- no loop, no plan tuple to walk."""
+        lines = [
+            "def convert_proto_to_dataclass("
+            "self, proto_instance, dataclass_cls, mapped_fields):",
+            "    dataclass_instance = dataclass_cls()",
+            "    _g = getattr",
+            "    _m = _MISSING",
+        ]
+        for dc_field, pr_field, _ in field_plan:
+            lines.append(f"    v = _g(proto_instance, {pr_field!r}, _m)")
+            lines.append("    if v is not _m:")
+            lines.append(f"        dataclass_instance.{dc_field} = v")
+        lines.append("    return dataclass_instance")
+        namespace = {"_MISSING": _MISSING}
+        exec("\n".join(lines), namespace)
+        return namespace["convert_proto_to_dataclass"]
+
+    @classmethod
+    def _codegen_dc_to_proto(cls, field_plan):
+        """Exec-compile a converter specialized to the field plan.
+
+        The mapping is fixed at class creation, so instead of a generic
+        loop dispatching on plan metadata per call, each Mapper class
+        gets a straight-line function of plain attribute copies -- the
+        same partial-evaluation trick dataclasses uses for __init__."""
+        lines = [
+            "def convert_dataclass_to_proto("
+            "self, dataclass_instance, proto_cls, mapped_fields):",
+            "    proto_instance = proto_cls()",
+            # Locals for names read once per field: LOAD_FAST instead
+            # of LOAD_GLOBAL in the generated body.
+            "    _g = getattr",
+            "    _m = _MISSING",
+        ]
+        for dc_field, pr_field, mtype_name in field_plan:
+            if mtype_name and mtype_name != "google.protobuf.Timestamp":
+                # Non-Timestamp sub-messages are not converted (same as
+                # the generic loop, which skipped them).
+                continue
+            lines.append(
+                f"    v = _g(dataclass_instance, {dc_field!r}, _m)"
+            )
+            lines.append("    if v is not _m:")
+            if mtype_name:
+                lines.extend(
+                    [
+                        "        try:",
+                        f"            _assign_timestamp("
+                        f"proto_instance.{pr_field}, v)",
+                        "        except Exception as e:",
+                        "            raise ValueError(",
+                        f"                f\"Error converting "
+                        f"dataclass.{dc_field}\"",
+                        "                f\" value '{v}' to \"",
+                        f"                f\"proto.{pr_field}: {{e}}\")",
+                    ]
+                )
+            else:
+                lines.append(f"        proto_instance.{pr_field} = v")
+        lines.append("    return proto_instance")
+        namespace = {
+            "_MISSING": _MISSING,
+            "_assign_timestamp": _assign_timestamp,
+        }
+        exec("\n".join(lines), namespace)
+        return namespace["convert_dataclass_to_proto"]
+
+    @staticmethod
+    def _build_field_plan(pr_class, mapped_fields):
+        """Flatten the mapping into (dc_field, pr_field, message_type
+        full name or None) triples so the conversion loops iterate a
+        frozen tuple instead of re-reading the proto descriptor."""
+        # Descriptors are immutable, so the plan is fully determined by
+        # the proto class and the mapping; functionally identical Mapper
+        # classes (fixtures, factories) reuse it instead of re-walking
+        # the descriptor.
+        cache_key = (pr_class, tuple(sorted(mapped_fields.items())))
+        cached = _PLAN_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        fields_by_name = pr_class.DESCRIPTOR.fields_by_name
+        plan = []
+        for dc_field, pr_field in mapped_fields.items():
+            mtype = fields_by_name[pr_field].message_type
+            plan.append(
+                (dc_field, pr_field, mtype.full_name if mtype else None)
+            )
+        plan = tuple(plan)
+        _PLAN_CACHE[cache_key] = plan
+        return plan
 
     @staticmethod
     def _get_proto(pr_input):
@@ -210,8 +384,12 @@ class MapperMeta(type):
         """Returns a dictionary of mapped fields where the keys are the
         dataclass field names and the values are the protobuf field names."""
         new_map = {}
-        dc_keys = [f.name for f in fields(dc_class)]
-        pr_keys = [f.name for f in pr_class.DESCRIPTOR.fields]
+        # Ordered name lists drive iteration; the sets make the
+        # membership checks O(1) instead of scanning a list per field.
+        dc_names = [f.name for f in fields(dc_class)]
+        pr_names = [f.name for f in pr_class.DESCRIPTOR.fields]
+        dc_keys = set(dc_names)
+        pr_keys = set(pr_names)
         for dc_key, pr_key in mapped_fields.items():
             if dc_key in dc_keys and pr_key in pr_keys:
                 new_map[dc_key] = pr_key
@@ -219,10 +397,10 @@ class MapperMeta(type):
                 raise ValueError(f"Invalid protobuf field: {pr_key}")
             else:
                 raise ValueError(f"Invalid dataclass field: {dc_key}")
-        for dc_key in dc_keys:
+        for dc_key in dc_names:
             if dc_key not in new_map and dc_key in pr_keys:
                 new_map[dc_key] = dc_key
-        for pr_key in pr_keys:
+        for pr_key in pr_names:
             if pr_key not in new_map and pr_key in dc_keys:
                 new_map[pr_key] = pr_key
         return new_map
@@ -285,166 +463,3 @@ class MapperMeta(type):
 #     last_name="Smith",
 #     date_of_birth=dt.date(1973, 8, 30),
 # )  # noqa
-
-
-class MapperMeta_old(type):
-    def __new__(mcs, name, bases, dct):
-        dataclass = dct.get("__dataclass__", None)
-        protobuf = dct.get("__protobuf__", None)
-        mapped_fields = dct.get("__mapped_fields__", {})
-        transforms = dct.get("__transforms__", {})
-        child_mapper = dct.get("__child_mapper__", {})
-
-        if dataclass is None or protobuf is None:
-            raise ValueError(
-                "Both __dataclass__ and __protobuf__ must be "
-                "defined in the mapper class."
-            )
-
-        cls = super().__new__(mcs, name, bases, dct)
-        cls.__init__ = mcs.__init
-        cls.dataclass = property(mcs.dataclass)
-        cls.protobuf = property(mcs.protobuf)
-        cls._transforms = transforms
-        cls._mapped_fields = mapped_fields
-        cls._child_mapper = child_mapper
-        cls.transform_value = staticmethod(mcs.__transform_value)
-        cls.dataclass_cls = dataclass
-        cls.proto_cls = protobuf
-        cls.fields = dataclass.fields()
-
-        # Set default methods in MapperClass
-        cls._convert_to_protobuf = mcs.__default_convert_to_protobuf(cls)
-        cls._convert_to_dataclass = mcs.__default_convert_to_dataclass(cls)
-        cls._mapped_fields = mapped_fields
-        return cls
-
-    @staticmethod
-    def __transform_value(func, source):
-        idx = None
-        if isinstance(func, tuple):
-            func, idx = func
-        val = func(source)
-        if idx is not None:
-            val = val[idx]
-        return val
-
-    @staticmethod
-    def __init(self, input_data):
-        if isinstance(input_data, self.dataclass_cls):
-            self._source_type = "dataclass"
-        elif isinstance(input_data, self.proto_cls):
-            self._source_type = "protobuf"
-        else:
-            raise ValueError(
-                "Input data must be either a dataclass or protobuf instance."
-            )
-
-        self._input_data = input_data
-        self._dataclass_instance = None
-        self._protobuf_instance = None
-
-    def dataclass(self):
-        if self._source_type == "dataclass":
-            return self._input_data
-        elif self._source_type == "protobuf":
-            if self._dataclass_instance is None:
-                self._dataclass_instance = self._convert_to_dataclass(
-                    self._input_data
-                )
-            return self._dataclass_instance
-
-    def protobuf(self):
-        if self._source_type == "protobuf":
-            return self._input_data
-        elif self._source_type == "dataclass":
-            if self._protobuf_instance is None:
-                self._protobuf_instance = self._convert_to_protobuf(
-                    self._input_data
-                )
-            return self._protobuf_instance
-
-    # Default conversion methods
-    @staticmethod
-    def __default_convert_to_protobuf(class_object):
-        def convert_to_proto(self, dataclass_instance):
-            # Default method to convert dataclass to protobuf...
-            transform = self._transforms.get("protobuf", {})
-            pb = self.proto_cls()
-            dc_data = self._input_data
-            for field, meta in self.dataclass_cls.fields().items():
-                pb_field = self._mapped_fields.get(field, field)
-
-                # Enum fields
-                if field in self.dataclass_cls.enum_fields():
-                    if enum_obj := getattr(dc_data, field, None):
-                        setattr(pb, pb_field, enum_obj.value)
-
-                # Date and datetime fields
-                elif field in self.dataclass_cls.datetime_fields():
-                    if dt_obj := getattr(dc_data, field, None):
-                        parser = DateParser(dt_obj)
-                        getattr(pb, pb_field).FromDatetime(parser.datetime)
-
-                # Json fields
-                elif field in self.dataclass_cls.json_fields():
-                    js = JsonType(getattr(dc_data, field, ""))
-                    setattr(pb, pb_field, js.str)
-
-                # Relationship fields
-                elif field in self.dataclass_cls.relationship_fields():
-                    values = getattr(dc_data, field, [])
-                    for value in values:
-                        child = getattr(pb, pb_field).add()
-                        if mapper := self._child_mapper.get(field, None):
-                            child_mapper = mapper(value)
-                            child.CopyFrom(child_mapper.protobuf)
-                        else:
-                            child.CopyFrom(value)
-
-                # Metadata fields
-                elif field in self.dataclass_cls.metadata_fields():
-                    meta_obj = getattr(dc_data, field)
-                    setattr(pb, pb_field, meta_obj.str)
-                # Other fields set directly based on defined
-                # datatype in proto
-                elif val := getattr(dc_data, field, None):
-                    if pb_field := pb.DESCRIPTOR.fields_by_name.get(
-                        pb_field, None
-                    ):
-                        if func := transform.get(field):
-                            val = self.transform_value(func, self)
-                        # Strings
-                        if pb_field.type in [
-                            pb_field.TYPE_STRING,
-                            pb_field.TYPE_BYTES,
-                        ]:
-                            val = str(val)
-                        # Integers
-                        elif pb_field.type in [
-                            pb_field.TYPE_INT32,
-                            pb_field.TYPE_INT64,
-                        ]:
-                            val = int(val)
-                        # Floats
-                        elif pb_field.type in [
-                            pb_field.TYPE_DOUBLE,
-                            pb_field.TYPE_FLOAT,
-                        ]:
-                            val = float(val)
-                        setattr(pb, field, val)
-
-            for field in transform.keys():
-                value = self.transform_value(transform[field], self)
-                setattr(pb, field, value)
-            return pb
-
-        return convert_to_proto
-
-    @staticmethod
-    def __default_convert_to_dataclass(class_object):
-        def convert_to_dc(self, protobuf_instance):
-            # Default method to convert protobuf to dataclass...
-            return True
-
-        return convert_to_dc
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from dataclasses import dataclass
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from common_core.utils.mapping.proto_dataclass import MapperMeta
+
+
+def _build_person_proto():
+    # The repo ships no compiled protos, so the test builds one
+    # dynamically; descriptors registered in the default pool persist
+    # for the process, which is fine for a module-level fixture.
+    file_proto = descriptor_pb2.FileDescriptorProto()
+    file_proto.name = "test_proto_dataclass.proto"
+    file_proto.package = "common_core.tests"
+    message = file_proto.message_type.add()
+    message.name = "Person"
+    name = message.field.add()
+    name.name, name.number = "name", 1
+    name.type, name.label = name.TYPE_STRING, name.LABEL_OPTIONAL
+    age = message.field.add()
+    age.name, age.number = "age", 2
+    age.type, age.label = age.TYPE_INT32, age.LABEL_OPTIONAL
+    descriptor = descriptor_pool.Default().Add(file_proto)
+    return message_factory.GetMessageClass(
+        descriptor.message_types_by_name["Person"]
+    )
+
+
+PersonProto = _build_person_proto()
+
+
+@dataclass
+class PersonDC:
+    name: str = ""
+    age: int = 0
+
+
+class PersonMapper(metaclass=MapperMeta):
+    __dataclass__ = PersonDC
+    __protobuf__ = PersonProto
+
+
+def test_batch_round_trip():
+    people = [PersonDC(name="Craig", age=50), PersonDC(name="Ada", age=36)]
+
+    protos = PersonMapper.batch_to_proto(people)
+    assert [(p.name, p.age) for p in protos] == [
+        ("Craig", 50),
+        ("Ada", 36),
+    ]
+
+    back = PersonMapper.batch_to_dataclass(protos)
+    assert back == people
+
+
+def test_batch_empty():
+    assert PersonMapper.batch_to_proto([]) == []
+    assert PersonMapper.batch_to_dataclass([]) == []
@@ -23,13 +23,31 @@ my_json_obj = JsonType({
 {'name': 'Craig', 'birthday': '1973-08-30T00:00:00'}
 
 """
+import functools
+import json
+
 from common_core.utils.metaclass import jsonn
 
 
+@functools.lru_cache(maxsize=1024)
+def _is_valid_json_str(value: str) -> bool:
+    # The probe is pure for strings, and mapper json-field paths tend
+    # to revalidate the same payloads.
+    try:
+        jsonn.loads(value)
+        return True
+    except Exception:
+        return False
+
+
 class JsonType(dict):
     """A datatype to denote that a value is a JSON-friendly object -- either
     a serializable Python object, a JSON-string, or another JsonType object."""
 
+    # Sidecar attributes only; the dict payload itself lives in the
+    # base type, so slotting drops the per-instance __dict__.
+    __slots__ = ("_data", "_data_type", "_force_list", "_raw")
+
     def __str__(self):
         return self.str
 
@@ -43,6 +61,7 @@ class JsonType(dict):
         self._data = content or dict()
         self._data_type = None
         self._force_list = force_list is not None
+        self._raw = None
         self.__validate_content()
         if content := self._data:
             super().__init__(content)
@@ -58,12 +77,29 @@ class JsonType(dict):
         if not self.is_valid_json(data):
             raise Exception(self.__json_error_msg())
 
-        self._data = jsonn.loads(data) if isinstance(data, str) else data
-        self._data_type = list if force_list else type(self._data)
-        if isinstance(self._data, list):
-            self.__init__(
-                dict([(i, v) for i, v in enumerate(self._data)]), True
-            )
+        if isinstance(data, str):
+            raw = data
+            try:
+                # Strict JSON text can be handed back verbatim from
+                # .str, skipping the parse/re-encode round trip for
+                # forward-only consumers.
+                data = json.loads(raw)
+                self._raw = raw
+            except (json.JSONDecodeError, TypeError):
+                data = jsonn.loads(raw)
+            if self._force_list and not isinstance(data, list):
+                # .str must reflect the forced list shape, not the
+                # original text.
+                self._raw = None
+        if isinstance(data, list):
+            # Index the items directly; re-entering __init__ here used
+            # to re-run the whole validation (another full JSON round
+            # trip) on data already known to be valid.
+            data = dict(enumerate(data))
+            force_list = True
+        self._data = data
+        self._force_list = force_list
+        self._data_type = list if force_list else type(data)
 
     @property
     def obj(self):
@@ -74,6 +110,8 @@ class JsonType(dict):
 
     @property
     def str(self):
+        if self._raw is not None:
+            return self._raw
         return jsonn.dumps(self.obj)
 
     @property
@@ -85,11 +123,10 @@ class JsonType(dict):
     def is_valid_json(value):
         if isinstance(value, JsonType):
             return True
+        if isinstance(value, str):
+            return _is_valid_json_str(value)
         try:
-            if isinstance(value, str):
-                jsonn.loads(value)
-            else:
-                jsonn.dumps(value)
+            jsonn.dumps(value)
             return True
         except Exception:
             return False
@@ -3,11 +3,16 @@
 
 import ast
 import datetime
-import functools
 import json
+import re
 
-import dateutil.parser
-import jsonschema
+try:
+    # C-level parser, 2-5x faster than stdlib json on loads.  dumps
+    # stays on stdlib: orjson emits compact separators and callers
+    # (JsonType.str) rely on the stdlib formatting.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 __all__ = ["dumps", "loads"]
 
@@ -24,35 +29,76 @@ class DatetimeJSONEncoder(json.JSONEncoder):
         return super(DatetimeJSONEncoder, self).default(obj)
 
 
-dumps = functools.partial(json.dumps, cls=DatetimeJSONEncoder)
+# json.dumps builds a fresh encoder on every call when given cls=;
+# the common no-kwargs call reuses one instance instead.  Default
+# encoder settings match json.dumps output exactly.
+_encoder = DatetimeJSONEncoder()
+
+
+def dumps(obj, **kwargs):
+    if not kwargs:
+        return _encoder.encode(obj)
+    kwargs.setdefault("cls", DatetimeJSONEncoder)
+    return json.dumps(obj, **kwargs)
 
 
 def validate_json(data, schema):
     """Validates a JSON object against a schema."""
+    # Deferred: jsonschema is only needed when a schema is supplied,
+    # and importing it eagerly inflates cold start for every caller.
+    import jsonschema
+
     schema_validator = jsonschema.Draft7Validator(schema)
     return schema_validator.validate(data)
 
 
 def loads(s, schema=None, **kwargs):
-    """Loads a JSON string into a Python object."""
-    s = json.dumps(ast.literal_eval(s))
-    source = json.loads(s, **kwargs)
+    """Loads a JSON string into a Python object.
+
+    Valid JSON parses in a single pass; Python-literal input (e.g.
+    single-quoted dicts) falls back to ast.literal_eval plus a JSON
+    round trip, which is what every call used to pay."""
+    try:
+        if _orjson is not None and not kwargs:
+            source = _orjson.loads(s)
+        else:
+            source = json.loads(s, **kwargs)
+    except (json.JSONDecodeError, TypeError):
+        source = json.loads(json.dumps(ast.literal_eval(s)), **kwargs)
     if schema:
         validate_json(source, schema)
     return source
 
 
+# ISO-shaped strings take the much cheaper isoparse path; everything
+# else still goes through the full fuzzy parser as before.
+_ISO_DATE_MATCH = re.compile(r"\d{4}-\d{2}-\d{2}").match
+
+
 def iteritems(source):
-    for k, v in source.items():
-        if isinstance(v, (list, tuple)):
-            for a in v:
-                if hasattr(a, "items"):
-                    iteritems(a)
-        elif isinstance(v, dict):
-            iteritems(v)
-        elif isinstance(v, str):
-            try:
-                source[k] = dateutil.parser.parse(v)
-            except (ValueError, OverflowError):
-                pass
+    import dateutil.parser
+
+    isoparse = dateutil.parser.isoparse
+    parse = dateutil.parser.parse
+    stack = [source]
+    while stack:
+        dct = stack.pop()
+        for k, v in dct.items():
+            if isinstance(v, (list, tuple)):
+                for a in v:
+                    if hasattr(a, "items"):
+                        stack.append(a)
+            elif isinstance(v, dict):
+                stack.append(v)
+            elif isinstance(v, str):
+                if _ISO_DATE_MATCH(v):
+                    try:
+                        dct[k] = isoparse(v)
+                        continue
+                    except (ValueError, OverflowError):
+                        pass
+                try:
+                    dct[k] = parse(v)
+                except (ValueError, OverflowError):
+                    pass
     return source
@@ -7,18 +7,15 @@ def get_abs_path(rel_path, ref_obj, ref_path=None):
     ref_path = ref_path or os.path.dirname(
         sys.modules[ref_obj.__module__].__file__
     )
-    if rel_path.startswith("../"):
-        rel_path = rel_path[:3]
-        ref_path_list = ref_path.split("/")
-        ref_path = "/".join(ref_path_list[:-1])
-        new_path = get_abs_path(rel_path, ref_obj, ref_path)
-    elif rel_path.startswith("/"):
+    if os.path.isabs(rel_path):
         new_path = rel_path
     else:
-        new_path = ref_path + "/" + rel_path
+        # normpath collapses any ../ segments in one C-level pass; the
+        # old manual split('/')/join recursion also never stripped the
+        # consumed '../', so deep relative paths looped until the
+        # reference path ran out.
+        new_path = os.path.normpath(os.path.join(ref_path, rel_path))
 
-    if new_path and os.path.isfile(new_path):
+    if os.path.isfile(new_path):
         return new_path
-    elif new_path:
-        raise Exception(f"File not found: {new_path}")
-    return None
+    raise Exception(f"File not found: {new_path}")
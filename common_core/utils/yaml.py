@@ -1,7 +1,14 @@
 import yaml
 
+try:
+    # libyaml-backed loader; same safe-construction semantics as
+    # SafeLoader but parses in C (~5-10x faster).
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 def load_yaml(filename):
     with open(filename) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
     return data or {}